@@ -22,7 +22,6 @@
 Decomposes a diagonal matrix into elementary gates using the method described in Theorem 7 in
 "Synthesis of Quantum Logic Circuits" by Shende et al. (https://arxiv.org/pdf/quant-ph/0406176.pdf).
 """
-import cmath
 import math
 
 import numpy as np
@@ -50,23 +49,18 @@ class DiagGate(Gate):
         num_action_qubits = math.log2(len(diag))
         if num_action_qubits < 1 or not num_action_qubits.is_integer():
             raise QiskitError("The number of diagonal entries is not a positive power of 2.")
-        for z in diag:
-            try:
-                complex(z)
-            except TypeError:
-                raise QiskitError("Not all of the diagonal entries can be converted to "
-                                  "complex numbers.")
-            if not np.abs(z) - 1 < _EPS:
-                raise QiskitError("A diagonal entry has not absolute value one.")
+        try:
+            diag_array = np.asarray(diag, dtype=np.complex128)
+        except (TypeError, ValueError):
+            raise QiskitError("Not all of the diagonal entries can be converted to "
+                              "complex numbers.")
+        if not np.all(np.abs(np.abs(diag_array) - 1) < _EPS):
+            raise QiskitError("A diagonal entry has not absolute value one.")
         # Create new gate.
         super().__init__("diag", int(num_action_qubits), diag)
 
     def _define(self):
         diag_circuit = self._dec_diag()
-        gate = diag_circuit.to_instruction()
-        q = QuantumRegister(self.num_qubits)
-        diag_circuit = QuantumCircuit(q)
-        diag_circuit.append(gate, q[:])
         self.definition = diag_circuit.data
 
     def _dec_diag(self):
@@ -77,27 +71,39 @@ class DiagGate(Gate):
         circuit = QuantumCircuit(q)
         # Since the diagonal is a unitary, all its entries have absolute value one and the diagonal
         # is fully specified by the phases of its entries
-        diag_phases = [cmath.phase(z) for z in self.params]
-        n = len(self.params)
-        while n >= 2:
-            angles_rz = []
-            for i in range(0, n, 2):
-                diag_phases[i // 2], rz_angle = _extract_rz(diag_phases[i], diag_phases[i + 1])
-                angles_rz.append(rz_angle)
-            num_act_qubits = int(np.log2(n))
-            contr_qubits = q[self.num_qubits - num_act_qubits + 1:self.num_qubits]
-            target_qubit = q[self.num_qubits - num_act_qubits]
-            circuit.ucz(angles_rz, contr_qubits, target_qubit)
-            n //= 2
+        diag_phases = np.angle(np.asarray(self.params, dtype=np.complex128))
+        angles_rz = _diag_rz_angles(diag_phases)
+        for level, angles in enumerate(angles_rz):
+            contr_qubits = q[level + 1:self.num_qubits]
+            target_qubit = q[level]
+            circuit.ucz(angles.tolist(), contr_qubits, target_qubit)
         return circuit
 
 
-# extract a Rz rotation (angle given by first output) such that exp(j*phase)*Rz(z_angle)
-# is equal to the diagonal matrix with entires exp(1j*ph1) and exp(1j*ph2)
-def _extract_rz(phi1, phi2):
-    phase = (phi1 + phi2) / 2.0
-    z_angle = phi2 - phi1
-    return phase, z_angle
+def _diag_rz_angles(diag_phases):
+    """
+    Compute the angles of the uniformly controlled Rz rotations of all the levels of the
+    decomposition at once. The array diag_phases is overwritten in place: at each level, the
+    phases of neighbouring pairs (at distance stride) are replaced by their mean, and the Rz
+    angle is given by their difference. The angles of all the levels are written into a single
+    preallocated array, so no temporary arrays are created.
+    """
+    num_entries = len(diag_phases)
+    all_angles = np.empty(num_entries - 1, dtype=np.float64)
+    angles_rz = []
+    offset = 0
+    stride = 1
+    while stride < num_entries:
+        even = diag_phases[::2 * stride]
+        odd = diag_phases[stride::2 * stride]
+        angles = all_angles[offset:offset + len(odd)]
+        np.subtract(odd, even, out=angles)
+        angles_rz.append(angles)
+        even += odd
+        even *= 0.5
+        offset += len(odd)
+        stride *= 2
+    return angles_rz
 
 
 def diag_gate(self, diag, qubit):
@@ -14,6 +14,9 @@
 
 """Pass for converting a circuit targeting U3,CX basis to Rx,Ry,Rxx."""
 
+from copy import deepcopy
+from functools import lru_cache
+
 from qiskit.transpiler.basepasses import TransformationPass
 from qiskit.exceptions import QiskitError
 
@@ -45,6 +48,11 @@ class MSBasisDecomposer(TransformationPass):
         super().__init__()
 
         self.basis = basis
+        self._basis_set = frozenset(basis)
+        # TODO: this is legacy behavior. basic_insts should be removed and these
+        #  instructions should be part of the device-reported basis. Currently, no
+        #  backend reports "measure", for example.
+        self._basic_insts = frozenset(['measure', 'reset', 'barrier', 'snapshot'])
         self.requires = [Unroller(list(set(basis).union(['u3', 'cx'])))]
 
     def run(self, dag):
@@ -61,16 +69,22 @@ class MSBasisDecomposer(TransformationPass):
         """
 
         one_q_decomposer = OneQubitEulerDecomposer(basis='XYX')
-        cnot_decomposition = cnot_rxx_decompose()
-
+        cnot_decomposition = circuit_to_dag(cnot_rxx_decompose())
+
+        # Circuits often repeat U3 gates with the same parameters, so their
+        # decompositions are memoized on the (rounded) parameters.
+        @lru_cache(maxsize=4096)
+        def u3_decomposition(params):
+            """Return the DAG decomposing a U3 gate with the given parameters."""
+            return circuit_to_dag(one_q_decomposer(U3Gate(*params)))
+
+        # Find the replacement of every node before modifying the dag, so that
+        # the dag is left untouched if a node cannot be converted.
+        substitutions = []
         for node in dag.op_nodes():
-            basic_insts = ['measure', 'reset', 'barrier', 'snapshot']
-            if node.name in basic_insts:
-                # TODO: this is legacy behavior. basic_insts should be removed and these
-                #  instructions should be part of the device-reported basis. Currently, no
-                #  backend reports "measure", for example.
+            if node.name in self._basic_insts:
                 continue
-            if node.name in self.basis:  # If already a base, ignore.
+            if node.name in self._basis_set:  # If already a base, ignore.
                 continue
 
             if not isinstance(node.op, self.supported_input_gates):
@@ -79,24 +93,27 @@ class MSBasisDecomposer(TransformationPass):
                                   (str(self.basis), node.op.name))
 
             if isinstance(node.op, U3Gate):
-                replacement_circuit = one_q_decomposer(node.op)
+                replacement_dag = u3_decomposition(
+                    tuple(round(float(param), 12) for param in node.op.params))
             elif isinstance(node.op, CnotGate):
-                # N.B. We can't circuit_to_dag once outside the loop because
-                # substitute_node_with_dag will modify the input DAG if the
-                # node to be replaced is conditional.
-
-                replacement_circuit = cnot_decomposition
+                replacement_dag = cnot_decomposition
             else:
                 raise QiskitError("Unable to handle instruction (%s, %s)."
                                   % (node.op.name, type(node.op)))
 
-            replacement_dag = circuit_to_dag(replacement_circuit)
+            # N.B. substitute_node_with_dag will modify the input DAG if the
+            # node to be replaced is conditional, so the shared decompositions
+            # are only copied in that case.
+            if node.condition:
+                replacement_dag = deepcopy(replacement_dag)
 
-            # N.B. wires kwarg can be omitted for both 1Q and 2Q substitutions.
-            # For 1Q, one-to-one mapping is always correct. For 2Q,
-            # cnot_rxx_decompose follows convention of control as q[0], target
-            # as q[1], which matches qarg order in CX node.
+            substitutions.append((node, replacement_dag))
 
+        # N.B. wires kwarg can be omitted for both 1Q and 2Q substitutions.
+        # For 1Q, one-to-one mapping is always correct. For 2Q,
+        # cnot_rxx_decompose follows convention of control as q[0], target
+        # as q[1], which matches qarg order in CX node.
+        for node, replacement_dag in substitutions:
             dag.substitute_node_with_dag(node, replacement_dag)
 
         return dag
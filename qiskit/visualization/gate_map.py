@@ -25,46 +25,45 @@ if HAS_MATPLOTLIB:
     from matplotlib import get_backend
     import matplotlib.pyplot as plt  # pylint: disable=import-error
     import matplotlib.patches as mpatches
+    from matplotlib.collections import EllipseCollection, LineCollection
     import matplotlib.cm as cm
     import matplotlib.gridspec as gridspec
     from matplotlib import ticker
 
 
-class _GraphDist():
-    """Transform the circles properly for non-square axes.
-    """
+# Grid positions (row, column) of the qubits of the devices supported by plot_gate_map,
+# keyed by number of qubits
+_MPL_GRIDS = {}
+
+_MPL_GRIDS[20] = np.array([[0, 0], [0, 1], [0, 2], [0, 3], [0, 4],
+                           [1, 0], [1, 1], [1, 2], [1, 3], [1, 4],
+                           [2, 0], [2, 1], [2, 2], [2, 3], [2, 4],
+                           [3, 0], [3, 1], [3, 2], [3, 3], [3, 4]], dtype=np.int8)
+
+_MPL_GRIDS[14] = np.array([[0, 0], [0, 1], [0, 2], [0, 3], [0, 4],
+                           [0, 5], [0, 6], [1, 7], [1, 6], [1, 5],
+                           [1, 4], [1, 3], [1, 2], [1, 1]], dtype=np.int8)
+
+_MPL_GRIDS[16] = np.array([[1, 0], [0, 0], [0, 1], [0, 2], [0, 3],
+                           [0, 4], [0, 5], [0, 6], [0, 7], [1, 7],
+                           [1, 6], [1, 5], [1, 4], [1, 3], [1, 2], [1, 1]], dtype=np.int8)
 
-    def __init__(self, size, ax, x=True):
-        self.size = size
-        self.ax = ax  # pylint: disable=invalid-name
-        self.x = x
-
-    @property
-    def dist_real(self):
-        """Compute distance.
-        """
-        x0, y0 = self.ax.transAxes.transform(  # pylint: disable=invalid-name
-            (0, 0))
-        x1, y1 = self.ax.transAxes.transform(  # pylint: disable=invalid-name
-            (1, 1))
-        value = x1 - x0 if self.x else y1 - y0
-        return value
-
-    @property
-    def dist_abs(self):
-        """Distance abs
-        """
-        bounds = self.ax.get_xlim() if self.x else self.ax.get_ylim()
-        return bounds[0] - bounds[1]
-
-    @property
-    def value(self):
-        """Return value.
-        """
-        return (self.size / self.dist_real) * self.dist_abs
-
-    def __mul__(self, obj):
-        return self.value * obj
+_MPL_GRIDS[5] = np.array([[1, 0], [0, 1], [1, 1], [1, 2], [2, 1]], dtype=np.int8)
+
+_MPL_GRIDS[53] = np.array([[0, 2], [0, 3], [0, 4], [0, 5], [0, 6],
+                           [1, 2], [1, 6],
+                           [2, 0], [2, 1], [2, 2], [2, 3], [2, 4],
+                           [2, 5], [2, 6], [2, 7], [2, 8],
+                           [3, 0], [3, 4], [3, 8],
+                           [4, 0], [4, 1], [4, 2], [4, 3], [4, 4],
+                           [4, 5], [4, 6], [4, 7], [4, 8],
+                           [5, 2], [5, 6],
+                           [6, 0], [6, 1], [6, 2], [6, 3], [6, 4],
+                           [6, 5], [6, 6], [6, 7], [6, 8],
+                           [7, 0], [7, 4], [7, 8],
+                           [8, 0], [8, 1], [8, 2], [8, 3], [8, 4],
+                           [8, 5], [8, 6], [8, 7], [8, 8],
+                           [9, 2], [9, 6]], dtype=np.int8)
 
 
 def plot_gate_map(backend, figsize=None,
@@ -85,7 +84,7 @@ def plot_gate_map(backend, figsize=None,
         figsize (tuple): Output figure size (wxh) in inches.
         plot_directed (bool): Plot directed coupling map.
         label_qubits (bool): Label the qubits.
-        qubit_size (float): Size of qubit marker.
+        qubit_size (float): Size of qubit marker (in pixels).
         line_width (float): Width of lines.
         font_size (int): Font size of qubit labels.
         qubit_color (list): A list of colors for the qubits
@@ -98,7 +97,8 @@ def plot_gate_map(backend, figsize=None,
         Figure: A Matplotlib figure instance.
 
     Raises:
-        QiskitError: if tried to pass a simulator.
+        QiskitError: if tried to pass a simulator, or if the lengths of
+            qubit_labels, qubit_color or line_color do not match the device.
         ImportError: if matplotlib not installed.
     """
     if not HAS_MATPLOTLIB:
@@ -111,38 +111,6 @@ def plot_gate_map(backend, figsize=None,
     if ax:
         input_axes = True
 
-    mpl_data = {}
-
-    mpl_data[20] = [[0, 0], [0, 1], [0, 2], [0, 3], [0, 4],
-                    [1, 0], [1, 1], [1, 2], [1, 3], [1, 4],
-                    [2, 0], [2, 1], [2, 2], [2, 3], [2, 4],
-                    [3, 0], [3, 1], [3, 2], [3, 3], [3, 4]]
-
-    mpl_data[14] = [[0, 0], [0, 1], [0, 2], [0, 3], [0, 4],
-                    [0, 5], [0, 6], [1, 7], [1, 6], [1, 5],
-                    [1, 4], [1, 3], [1, 2], [1, 1]]
-
-    mpl_data[16] = [[1, 0], [0, 0], [0, 1], [0, 2], [0, 3],
-                    [0, 4], [0, 5], [0, 6], [0, 7], [1, 7],
-                    [1, 6], [1, 5], [1, 4], [1, 3], [1, 2], [1, 1]]
-
-    mpl_data[5] = [[1, 0], [0, 1], [1, 1], [1, 2], [2, 1]]
-
-    mpl_data[53] = [[0, 2], [0, 3], [0, 4], [0, 5], [0, 6],
-                    [1, 2], [1, 6],
-                    [2, 0], [2, 1], [2, 2], [2, 3], [2, 4],
-                    [2, 5], [2, 6], [2, 7], [2, 8],
-                    [3, 0], [3, 4], [3, 8],
-                    [4, 0], [4, 1], [4, 2], [4, 3], [4, 4],
-                    [4, 5], [4, 6], [4, 7], [4, 8],
-                    [5, 2], [5, 6],
-                    [6, 0], [6, 1], [6, 2], [6, 3], [6, 4],
-                    [6, 5], [6, 6], [6, 7], [6, 8],
-                    [7, 0], [7, 4], [7, 8],
-                    [8, 0], [8, 1], [8, 2], [8, 3], [8, 4],
-                    [8, 5], [8, 6], [8, 7], [8, 8],
-                    [9, 2], [9, 6]]
-
     config = backend.configuration()
     n_qubits = config.n_qubits
     cmap = config.coupling_map
@@ -155,16 +123,33 @@ def plot_gate_map(backend, figsize=None,
                               'does not equal number '
                               'of qubits.')
 
-    if n_qubits in mpl_data.keys():
-        grid_data = mpl_data[n_qubits]
-    else:
+    # set coloring
+    if qubit_color is None:
+        qubit_color = ['#648fff'] * config.n_qubits
+    if line_color is None:
+        line_color = ['#648fff'] * len(cmap)
+    if len(qubit_color) != n_qubits:
+        raise QiskitError('Length of qubit colors '
+                          'does not equal number '
+                          'of qubits.')
+    if len(line_color) != len(cmap):
+        raise QiskitError('Length of line colors '
+                          'does not equal number '
+                          'of couplings.')
+
+    grid_data = _MPL_GRIDS.get(n_qubits)
+    if grid_data is None:
         if not input_axes:
             fig, ax = plt.subplots(figsize=(5, 5))  # pylint: disable=invalid-name
             ax.axis('off')
             return fig
 
-    x_max = max([d[1] for d in grid_data])
-    y_max = max([d[0] for d in grid_data])
+    # Row and column of each qubit in the grid
+    grid_rows = grid_data[:, 0]
+    grid_cols = grid_data[:, 1]
+
+    x_max = grid_cols.max()
+    y_max = grid_rows.max()
     max_dim = max(x_max, y_max)
 
     if figsize is None:
@@ -177,36 +162,29 @@ def plot_gate_map(backend, figsize=None,
         fig, ax = plt.subplots(figsize=figsize)  # pylint: disable=invalid-name
         ax.axis('off')
 
-    # set coloring
-    if qubit_color is None:
-        qubit_color = ['#648fff'] * config.n_qubits
-    if line_color is None:
-        line_color = ['#648fff'] * len(cmap)
+    # Compute the end points of all the couplings at once. Couplings present in both directions
+    # are only drawn up to their midpoint.
+    edges = np.asarray(cmap, dtype=int).reshape(-1, 2)
+    edge_set = {(start, end) for start, end in edges.tolist()}
+    symmetric = np.fromiter(((end, start) in edge_set for start, end in edges.tolist()),
+                            dtype=bool, count=len(edges))
+    y_starts = grid_rows[edges[:, 0]]
+    x_starts = grid_cols[edges[:, 0]]
+    y_ends = grid_rows[edges[:, 1]]
+    x_ends = grid_cols[edges[:, 1]]
+    x_ends = np.where(symmetric, (x_starts + x_ends) / 2, x_ends)
+    y_ends = np.where(symmetric, (y_starts + y_ends) / 2, y_ends)
 
     # Add lines for couplings
-    for ind, edge in enumerate(cmap):
-        is_symmetric = False
-        if edge[::-1] in cmap:
-            is_symmetric = True
-        y_start = grid_data[edge[0]][0]
-        x_start = grid_data[edge[0]][1]
-        y_end = grid_data[edge[1]][0]
-        x_end = grid_data[edge[1]][1]
-
-        if is_symmetric:
-            if y_start == y_end:
-                x_end = (x_end - x_start) / 2 + x_start
-
-            elif x_start == x_end:
-                y_end = (y_end - y_start) / 2 + y_start
-
-            else:
-                x_end = (x_end - x_start) / 2 + x_start
-                y_end = (y_end - y_start) / 2 + y_start
-        ax.add_artist(plt.Line2D([x_start, x_end], [-y_start, -y_end],
-                                 color=line_color[ind], linewidth=line_width,
-                                 zorder=0))
-        if plot_directed:
+    segments = np.stack([np.column_stack([x_starts, -y_starts]),
+                         np.column_stack([x_ends, -y_ends])], axis=1)
+    ax.add_collection(LineCollection(segments, colors=line_color, linewidths=line_width,
+                                     capstyle='projecting', zorder=0))
+
+    if plot_directed:
+        for ind, (x_start, y_start, x_end, y_end, is_symmetric) in enumerate(
+                zip(x_starts.tolist(), y_starts.tolist(), x_ends.tolist(), y_ends.tolist(),
+                    symmetric.tolist())):
             dx = x_end - x_start  # pylint: disable=invalid-name
             dy = y_end - y_start  # pylint: disable=invalid-name
             if is_symmetric:
@@ -232,14 +210,15 @@ def plot_gate_map(backend, figsize=None,
                                              facecolor=line_color[ind],
                                              zorder=1))
 
-    # Add circles for qubits
-    for var, idx in enumerate(grid_data):
-        _idx = [idx[1], -idx[0]]
-        width = _GraphDist(qubit_size, ax, True)
-        height = _GraphDist(qubit_size, ax, False)
-        ax.add_artist(mpatches.Ellipse(
-            _idx, width, height, color=qubit_color[var], zorder=1))
-        if label_qubits:
+    # Add circles for qubits. The circle size is given in pixels, so the circles stay round
+    # on non-square axes.
+    qubit_coords = np.column_stack([grid_cols, -grid_rows])
+    ax.add_collection(EllipseCollection(qubit_size, qubit_size, 0, units='dots',
+                                        offsets=qubit_coords, transOffset=ax.transData,
+                                        facecolors=qubit_color, edgecolors=qubit_color,
+                                        zorder=1))
+    if label_qubits:
+        for var, _idx in enumerate(qubit_coords.tolist()):
             ax.text(*_idx, s=qubit_labels[var],
                     horizontalalignment='center',
                     verticalalignment='center',
@@ -315,6 +294,86 @@ def plot_circuit_layout(circuit, backend, view='virtual'):
     return fig
 
 
+def _u2_errors(props, n_qubits):
+    """Return the U2 error rate of each qubit.
+
+    Args:
+        props (dict): Backend properties, as a dictionary.
+        n_qubits (int): Number of qubits of the backend.
+
+    Returns:
+        ndarray: The U2 error rates, ordered by qubit.
+
+    Raises:
+        VisualizationError: if the properties do not report one single qubit
+            gate error for each qubit.
+    """
+    u2_errors = {gate['qubits'][0]: gate['parameters'][0]['value']
+                 for gate in props['gates'] if gate.get('gate') == 'u2'}
+    if len(u2_errors) == n_qubits:
+        return np.fromiter((u2_errors[qubit] for qubit in range(n_qubits)),
+                           dtype=float, count=n_qubits)
+    # Fall back to the u1, u2, u3 ordering of the gates of each qubit
+    single_gates = [gate for gate in props['gates'][1:3 * n_qubits:3]
+                    if len(gate['qubits']) == 1]
+    if len(single_gates) != n_qubits:
+        raise VisualizationError('Backend properties do not report a single qubit '
+                                 'gate error for each qubit.')
+    return np.asarray([gate['parameters'][0]['value'] for gate in single_gates])
+
+
+def _cx_errors(props, cmap):
+    """Return the CX error rate of each coupling.
+
+    Args:
+        props (dict): Backend properties, as a dictionary.
+        cmap (list): Coupling map of the backend.
+
+    Returns:
+        ndarray: The CX error rates, ordered as the couplings in cmap.
+
+    Raises:
+        VisualizationError: if no two-qubit gate error is reported for a coupling.
+    """
+    # Error of the first two-qubit gate reported on each pair of qubits
+    two_q_errors = {}
+    for item in props['gates']:
+        if len(item['qubits']) == 2:
+            two_q_errors.setdefault(tuple(item['qubits']), item['parameters'][0]['value'])
+    cx_errors = np.empty(len(cmap))
+    for ind, line in enumerate(cmap):
+        value = two_q_errors.get(tuple(line))
+        if value is None:
+            raise VisualizationError('Backend properties do not report a two-qubit '
+                                     'gate error for coupling %s.' % list(line))
+        cx_errors[ind] = value
+    return cx_errors
+
+
+def _readout_errors(props, n_qubits):
+    """Return the readout error of each qubit.
+
+    Args:
+        props (dict): Backend properties, as a dictionary.
+        n_qubits (int): Number of qubits of the backend.
+
+    Returns:
+        ndarray: The readout errors, ordered by qubit.
+
+    Raises:
+        VisualizationError: if the readout error of a qubit is not reported.
+    """
+    read_err = np.empty(n_qubits)
+    for qubit in range(n_qubits):
+        value = next((item['value'] for item in props['qubits'][qubit]
+                      if item['name'] == 'readout_error'), None)
+        if value is None:
+            raise VisualizationError('Backend properties do not report the readout '
+                                     'error of qubit %s.' % qubit)
+        read_err[qubit] = value
+    return read_err
+
+
 def plot_error_map(backend, figsize=(12, 9), show_title=True):
     """Plots the error map of a given backend.
 
@@ -327,7 +386,8 @@ def plot_error_map(backend, figsize=(12, 9), show_title=True):
         Figure: A matplotlib figure showing error map.
 
     Raises:
-        VisualizationError: Input is not IBMQ backend.
+        VisualizationError: Input is not IBMQ backend, or its properties do
+            not report the error rates needed.
     """
     color_map = cm.viridis
 
@@ -336,12 +396,8 @@ def plot_error_map(backend, figsize=(12, 9), show_title=True):
 
     n_qubits = config['n_qubits']
 
-    # U2 error rates
-    single_gate_errors = [q['parameters'][0]['value']
-                          for q in props['gates'][1:3 * n_qubits:3]]
-
-    # Convert to percent
-    single_gate_errors = 100 * np.asarray(single_gate_errors)
+    # U2 error rates, in percent
+    single_gate_errors = 100 * _u2_errors(props, n_qubits)
     avg_1q_err = np.mean(single_gate_errors)
 
     single_norm = matplotlib.colors.Normalize(
@@ -352,40 +408,21 @@ def plot_error_map(backend, figsize=(12, 9), show_title=True):
 
     directed = False
     if n_qubits < 20:
-        for edge in cmap:
-            if not [edge[1], edge[0]] in cmap:
-                directed = True
-                break
-
-    cx_errors = []
-    for line in cmap:
-        for item in props['gates']:
-            if item['qubits'] == line:
-                cx_errors.append(item['parameters'][0]['value'])
-                break
-        else:
-            continue
+        edge_set = {tuple(edge) for edge in cmap}
+        directed = any((edge[1], edge[0]) not in edge_set for edge in cmap)
 
-    # Convert to percent
-    cx_errors = 100 * np.asarray(cx_errors)
+    # CX error rates, in percent
+    cx_errors = 100 * _cx_errors(props, cmap)
     avg_cx_err = np.mean(cx_errors)
 
     cx_norm = matplotlib.colors.Normalize(
         vmin=min(cx_errors), vmax=max(cx_errors))
     line_colors = [color_map(cx_norm(err)) for err in cx_errors]
 
-    # Measurement errors
-
-    read_err = []
-
-    for qubit in range(n_qubits):
-        for item in props['qubits'][qubit]:
-            if item['name'] == 'readout_error':
-                read_err.append(item['value'])
-
-    read_err = 100 * np.asarray(read_err)
-    avg_read_err = np.mean(read_err)
-    max_read_err = np.max(read_err)
+    # Measurement errors, in percent
+    read_err = 100 * _readout_errors(props, n_qubits)
+    avg_read_err = read_err.mean()
+    max_read_err = read_err.max()
 
     fig = plt.figure(figsize=figsize)
     gridspec.GridSpec(nrows=2, ncols=3)
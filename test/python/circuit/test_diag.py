@@ -20,6 +20,8 @@ import numpy as np
 
 from qiskit import QuantumCircuit, QuantumRegister, BasicAer, execute
 
+from qiskit.exceptions import QiskitError
+from qiskit.extensions.quantum_initializer.diag import DiagGate
 from qiskit.test import QiskitTestCase
 from qiskit.compiler import transpile
 from qiskit.quantum_info.operators.predicates import matrix_equal
@@ -50,6 +52,12 @@ class TestDiagGate(QiskitTestCase):
                 unitary_desired = _get_diag_gate_matrix(diag)
                 self.assertTrue(matrix_equal(unitary, unitary_desired, ignore_phase=True))
 
+    def test_diag_gate_invalid_entries(self):
+        """Test that non-unitary or non-numeric diagonals are rejected."""
+        for diag in [[1, 0.5], [1, 0], [1, 1.5j], [1, 'a'], [np.nan, 1], [1, None]]:
+            with self.subTest(diag=diag):
+                self.assertRaises(QiskitError, DiagGate, diag)
+
 
 def _get_diag_gate_matrix(diag):
     return np.diagflat(diag)
@@ -0,0 +1,87 @@
+# -*- coding: utf-8 -*-
+
+# This code is part of Qiskit.
+#
+# (C) Copyright IBM 2019.
+#
+# This code is licensed under the Apache License, Version 2.0. You may
+# obtain a copy of this license in the LICENSE.txt file in the root directory
+# of this source tree or at http://www.apache.org/licenses/LICENSE-2.0.
+#
+# Any modifications or derivative works of this code must retain this
+# copyright notice, and modified files need to carry a notice indicating
+# that they have been altered from the originals.
+
+"""Test the MSBasisDecomposer pass"""
+
+from qiskit import QuantumRegister, ClassicalRegister, QuantumCircuit
+from qiskit.transpiler.passes.ms_basis_decomposer import MSBasisDecomposer
+from qiskit.converters import circuit_to_dag, dag_to_circuit
+from qiskit.quantum_info import Operator
+from qiskit.test import QiskitTestCase
+from qiskit.exceptions import QiskitError
+
+
+class TestMSBasisDecomposer(QiskitTestCase):
+    """Tests the MSBasisDecomposer pass."""
+
+    def test_decompose_u3_cx(self):
+        """Test decomposing repeated U3 and CX gates preserves the unitary."""
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        for _ in range(2):
+            circuit.u3(0.1, 0.2, 0.3, qr[0])
+            circuit.u3(0.1, 0.2, 0.3, qr[1])
+            circuit.cx(qr[0], qr[1])
+            circuit.cx(qr[1], qr[0])
+        pass_ = MSBasisDecomposer(['rx', 'ry', 'rxx'])
+        out_dag = pass_.run(circuit_to_dag(circuit))
+        for node in out_dag.op_nodes():
+            self.assertIn(node.name, ['rx', 'ry', 'rxx'])
+        self.assertTrue(Operator(dag_to_circuit(out_dag)).equiv(Operator(circuit)))
+
+    def test_conditional_cx(self):
+        """Test a conditional CX does not condition other CX replacements."""
+        qr = QuantumRegister(2, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.cx(qr[0], qr[1])
+        circuit.cx(qr[0], qr[1]).c_if(cr, 1)
+        circuit.cx(qr[0], qr[1])
+        pass_ = MSBasisDecomposer(['rx', 'ry', 'rxx'])
+        out_dag = pass_.run(circuit_to_dag(circuit))
+        single_cx = QuantumCircuit(qr)
+        single_cx.cx(qr[0], qr[1])
+        cnot_size = len(pass_.run(circuit_to_dag(single_cx)).op_nodes())
+        conditions = [node.condition for node in out_dag.op_nodes()]
+        self.assertEqual(len(conditions), 3 * cnot_size)
+        self.assertEqual(conditions.count((cr, 1)), cnot_size)
+
+    def test_conditional_u3(self):
+        """Test a conditional U3 does not condition other U3 replacements."""
+        qr = QuantumRegister(1, 'qr')
+        cr = ClassicalRegister(1, 'cr')
+        circuit = QuantumCircuit(qr, cr)
+        circuit.u3(0.1, 0.2, 0.3, qr[0])
+        circuit.u3(0.1, 0.2, 0.3, qr[0]).c_if(cr, 1)
+        circuit.u3(0.1, 0.2, 0.3, qr[0])
+        pass_ = MSBasisDecomposer(['rx', 'ry', 'rxx'])
+        out_dag = pass_.run(circuit_to_dag(circuit))
+        single_u3 = QuantumCircuit(qr)
+        single_u3.u3(0.1, 0.2, 0.3, qr[0])
+        u3_size = len(pass_.run(circuit_to_dag(single_u3)).op_nodes())
+        conditions = [node.condition for node in out_dag.op_nodes()]
+        self.assertEqual(len(conditions), 3 * u3_size)
+        self.assertEqual(conditions.count((cr, 1)), u3_size)
+
+    def test_unsupported_gate_leaves_dag(self):
+        """Test the dag is not modified if a gate cannot be converted."""
+        qr = QuantumRegister(2, 'qr')
+        circuit = QuantumCircuit(qr)
+        circuit.u3(0.1, 0.2, 0.3, qr[0])
+        circuit.cx(qr[0], qr[1])
+        circuit.h(qr[1])
+        dag = circuit_to_dag(circuit)
+        pass_ = MSBasisDecomposer(['rx', 'ry', 'rxx'])
+        self.assertRaises(QiskitError, pass_.run, dag)
+        self.assertEqual(dag, circuit_to_dag(circuit))
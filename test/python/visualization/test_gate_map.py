@@ -17,9 +17,12 @@ import unittest
 import os
 
 from ddt import ddt, data
-from qiskit.test.mock import FakeProvider
+from qiskit.test.mock import FakeProvider, FakeYorktown, FakeRueschlikon, FakeTokyo
 from qiskit.test import QiskitTestCase
-from qiskit.visualization.gate_map import _GraphDist, plot_gate_map, plot_circuit_layout
+from qiskit.exceptions import QiskitError
+from qiskit.visualization.gate_map import (plot_gate_map, plot_circuit_layout, _u2_errors,
+                                           _readout_errors, _cx_errors)
+from qiskit.visualization.exceptions import VisualizationError
 from qiskit.tools.visualization import HAS_MATPLOTLIB
 from qiskit import QuantumRegister, QuantumCircuit
 from qiskit.transpiler import Layout
@@ -64,60 +67,72 @@ class TestGateMap(QiskitVisualizationTestCase):
         self.assertImagesAreEqual(filename, img_ref, 0.1)
         os.remove(filename)
 
-
-@unittest.skipIf(not HAS_MATPLOTLIB, 'matplotlib not available.')
-class TestGraphDist(QiskitTestCase):
-    """ tests _GraphdDist functions """
-
-    def setUp(self):
-        """ setup plots for _GraphDist """
-        ax1 = plt.subplots(figsize=(5, 5))[1]
-        ax2 = plt.subplots(figsize=(9, 3))[1]
-        ax1.axis("off")
-        ax2.axis("off")
-        self.ax1 = ax1
-        self.ax2 = ax2
-        self.ax1_x0, self.ax1_y0 = ax1.transAxes.transform((0, 0))
-        self.ax1_x1, self.ax1_y1 = ax1.transAxes.transform((1, 1))
-        self.ax2_x0, self.ax2_y0 = ax2.transAxes.transform((0, 0))
-        self.ax2_x1, self.ax2_y1 = ax2.transAxes.transform((1, 1))
-        self.ax1_bounds_x, self.ax1_bounds_y = ax1.get_xlim(), ax1.get_ylim()
-        self.ax2_bounds_x, self.ax2_bounds_y = ax2.get_xlim(), ax2.get_ylim()
-        self.size = 4
-        self.real_values = [self.ax1_x1 - self.ax1_x0, self.ax1_y1 - self.ax1_y0,
-                            self.ax2_x1 - self.ax2_x0, self.ax2_y1 - self.ax2_y0]
-        self.abs_values = [self.ax1_bounds_x[0] - self.ax1_bounds_x[1],
-                           self.ax1_bounds_y[0] - self.ax1_bounds_y[1],
-                           self.ax2_bounds_x[0] - self.ax2_bounds_x[1],
-                           self.ax2_bounds_y[0] - self.ax2_bounds_y[1]]
-        self.val = []
-        for i in range(4):
-            val = (self.size / self.real_values[i]) * self.abs_values[i]
-            self.val.append(val)
-
-    def test_dist_real(self):
-        """ tests dist_real calculation for different figsize """
-        params = [(self.ax1, self.real_values[0], True), (self.ax1, self.real_values[1], False),
-                  (self.ax2, self.real_values[2], True), (self.ax2, self.real_values[3], False)]
-        for test_val, expected_val, bool_op in params:
-            with self.subTest():
-                self.assertEqual(expected_val, _GraphDist(self.size, test_val, bool_op).dist_real)
-
-    def test_dist_abs(self):
-        """ tests dist_abs calculation for different figsize """
-        params = [(self.ax1, self.abs_values[0], True), (self.ax1, self.abs_values[1], False),
-                  (self.ax2, self.abs_values[2], True), (self.ax2, self.abs_values[3], False)]
-        for test_val, expected_val, bool_op in params:
-            with self.subTest():
-                self.assertEqual(expected_val, _GraphDist(self.size, test_val, bool_op).dist_abs)
-
-    def test_value(self):
-        """ tests value calculation for size = 4 """
-        params = [(self.ax1, self.val[0], True), (self.ax1, self.val[1], False),
-                  (self.ax2, self.val[2], True), (self.ax2, self.val[3], False)]
-        for test_val, expected_val, bool_op in params:
-            with self.subTest():
-                self.assertEqual(expected_val, _GraphDist(self.size, test_val, bool_op).value)
+    @unittest.skipIf(not HAS_MATPLOTLIB, 'matplotlib not available.')
+    def test_plot_gate_map_color_lengths(self):
+        """ tests plot_gate_map rejects color lists not matching the device"""
+        backend = FakeYorktown()
+        n_qubits = backend.configuration().n_qubits
+        n_edges = len(backend.configuration().coupling_map)
+        num_figures = plt.get_fignums()
+        with self.assertRaises(QiskitError):
+            plot_gate_map(backend, line_color=['r', 'g'])
+        with self.assertRaises(QiskitError):
+            plot_gate_map(backend, qubit_color=['r'] * (n_qubits - 1))
+        with self.assertRaises(QiskitError):
+            plot_gate_map(backend, line_color=['r'] * (n_edges + 1))
+        self.assertEqual(plt.get_fignums(), num_figures)
+
+
+class TestErrorMap(QiskitTestCase):
+    """ tests for the error rates used by plot_error_map """
+
+    def test_u2_errors_with_id_gates(self):
+        """ tests the u2 errors are selected on a backend also reporting id gates"""
+        backend = FakeYorktown()
+        props = backend.properties().to_dict()
+        n_qubits = backend.configuration().n_qubits
+        expected = [gate['parameters'][0]['value'] for qubit in range(n_qubits)
+                    for gate in props['gates']
+                    if gate['gate'] == 'u2' and gate['qubits'] == [qubit]]
+        self.assertEqual(len(expected), n_qubits)
+        self.assertEqual(props['gates'][0]['gate'], 'id')
+        self.assertEqual(list(_u2_errors(props, n_qubits)), expected)
+
+    def test_u2_errors_missing(self):
+        """ tests an error is raised if no single qubit gate errors are reported"""
+        backend = FakeRueschlikon()
+        props = backend.properties().to_dict()
+        n_qubits = backend.configuration().n_qubits
+        with self.assertRaises(VisualizationError):
+            _u2_errors(props, n_qubits)
+
+    def test_readout_errors_missing(self):
+        """ tests an error is raised if a qubit has no readout error"""
+        backend = FakeYorktown()
+        props = backend.properties().to_dict()
+        n_qubits = backend.configuration().n_qubits
+        self.assertEqual(len(_readout_errors(props, n_qubits)), n_qubits)
+        props['qubits'][2] = [item for item in props['qubits'][2]
+                              if item['name'] != 'readout_error']
+        with self.assertRaisesRegex(VisualizationError, 'qubit 2'):
+            _readout_errors(props, n_qubits)
+
+    def test_cx_errors_missing(self):
+        """ tests an error is raised if a coupling has no cx error"""
+        backend = FakeTokyo()
+        props = backend.properties().to_dict()
+        cmap = backend.configuration().coupling_map
+        with self.assertRaisesRegex(VisualizationError, r'coupling \[2, 3\]'):
+            _cx_errors(props, cmap)
+
+    def test_cx_errors_order(self):
+        """ tests the cx errors follow the order of the coupling map"""
+        backend = FakeYorktown()
+        props = backend.properties().to_dict()
+        cmap = backend.configuration().coupling_map
+        expected = [next(gate['parameters'][0]['value'] for gate in props['gates']
+                         if gate['qubits'] == line) for line in cmap]
+        self.assertEqual(list(_cx_errors(props, cmap)), expected)
 
 
 if __name__ == '__main__':